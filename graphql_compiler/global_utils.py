@@ -3,7 +3,6 @@ from dataclasses import dataclass
 from typing import Any, Dict, NamedTuple, Tuple
 
 from graphql import DocumentNode, GraphQLList, GraphQLNamedType, GraphQLNonNull
-import six
 
 
 # A path starting with a vertex and continuing with edges from that vertex
@@ -35,18 +34,15 @@ class ASTWithParameters:
 
 def merge_non_overlapping_dicts(merge_target, new_data):
     """Produce the merged result of two dicts that are supposed to not overlap."""
-    result = dict(merge_target)
-
-    for key, value in six.iteritems(new_data):
-        if key in merge_target:
-            raise AssertionError(
-                u'Overlapping key "{}" found in dicts that are supposed '
-                u"to not overlap. Values: {} {}".format(key, merge_target[key], value)
-            )
-
-        result[key] = value
-
-    return result
+    overlap = merge_target.keys() & new_data.keys()
+    if overlap:
+        key = next(iter(overlap))
+        raise AssertionError(
+            u'Overlapping key "{}" found in dicts that are supposed '
+            u"to not overlap. Values: {} {}".format(key, merge_target[key], new_data[key])
+        )
+
+    return {**merge_target, **new_data}
 
 
 def is_same_type(left, right):
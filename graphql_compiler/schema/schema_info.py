@@ -1,14 +1,12 @@
 # Copyright 2019-present Kensho Technologies, LLC.
 from abc import ABCMeta
-from collections import namedtuple
 from dataclasses import dataclass, field
 from enum import Enum, auto, unique
 from functools import partial
-from typing import Dict, Optional, Set
+from typing import Dict, NamedTuple, Optional, Set
 
 from graphql.type import GraphQLSchema
 from graphql.type.definition import GraphQLInterfaceType, GraphQLObjectType
-import six
 import sqlalchemy
 from sqlalchemy.dialects.mssql import dialect as mssql_dialect
 from sqlalchemy.dialects.mysql import dialect as mysql_dialect
@@ -20,23 +18,23 @@ from ..cost_estimation.statistics import Statistics
 from ..schema_generation.schema_graph import SchemaGraph
 
 
-# Describes the intent to join two tables using the specified columns.
-#
-# The resulting join expression could be something like:
-# JOIN origin_table.from_column = destination_table.to_column
-#
-# The type of join (inner vs left, etc.) is not specified.
-# The tables are not specified.
-DirectJoinDescriptor = namedtuple(
-    "DirectJoinDescriptor",
-    (
-        "from_column",  # The column in the source table we intend to join on.
-        "to_column",  # The column in the destination table we intend to join on.
-    ),
-)
+class DirectJoinDescriptor(NamedTuple):
+    """Describes the intent to join two tables using the specified columns.
 
+    The resulting join expression could be something like:
+    JOIN origin_table.from_column = destination_table.to_column
 
-@dataclass
+    The type of join (inner vs left, etc.) is not specified.
+    The tables are not specified.
+    """
+
+    # The column in the source table we intend to join on.
+    from_column: str
+    # The column in the destination table we intend to join on.
+    to_column: str
+
+
+@dataclass(frozen=True)
 class GenericSchemaInfo:
     """Class for storing generic schema info required for querying."""
 
@@ -61,7 +59,7 @@ class GenericSchemaInfo:
     type_equivalence_hints: Optional[Dict[str, str]]
 
 
-@dataclass
+@dataclass(frozen=True)
 class BackendSpecificSchemaInfo(metaclass=ABCMeta):
     """Common base class to be used by all backend-specific schema info classes.
 
@@ -70,18 +68,21 @@ class BackendSpecificSchemaInfo(metaclass=ABCMeta):
 
     generic_schema_info: GenericSchemaInfo
 
-    @property
-    def schema(self) -> GraphQLSchema:
-        """Return schema."""
-        return self.generic_schema_info.schema
+    # Flattened copies of the generic schema info's attributes, so that frequent reads
+    # (e.g. of the schema during query compilation) are plain attribute lookups instead
+    # of property calls that chase the extra nesting level.
+    schema: GraphQLSchema = field(init=False)
+    type_equivalence_hints: Optional[Dict[str, str]] = field(init=False)
 
-    @property
-    def type_equivalence_hints(self) -> Optional[Dict[str, str]]:
-        """Return type equivalence hints."""
-        return self.generic_schema_info.type_equivalence_hints
+    def __post_init__(self) -> None:
+        """Flatten the generic schema info's attributes onto this object."""
+        object.__setattr__(self, "schema", self.generic_schema_info.schema)
+        object.__setattr__(
+            self, "type_equivalence_hints", self.generic_schema_info.type_equivalence_hints
+        )
 
 
-@dataclass
+@dataclass(frozen=True)
 class MatchSchemaInfo(BackendSpecificSchemaInfo):
     pass
 
@@ -96,7 +97,7 @@ def create_match_schema_info(
     return MatchSchemaInfo(generic_schema_info=generic_schema_info)
 
 
-@dataclass
+@dataclass(frozen=True)
 class GremlinSchemaInfo(BackendSpecificSchemaInfo):
     pass
 
@@ -111,7 +112,7 @@ def create_gremlin_schema_info(
     return GremlinSchemaInfo(generic_schema_info=generic_schema_info)
 
 
-@dataclass
+@dataclass(frozen=True)
 class CypherSchemaInfo(BackendSpecificSchemaInfo):
     pass
 
@@ -126,7 +127,7 @@ def create_cypher_schema_info(
     return CypherSchemaInfo(generic_schema_info=generic_schema_info)
 
 
-@dataclass
+@dataclass(frozen=True)
 class SQLSchemaInfo(BackendSpecificSchemaInfo):
     """Schema information specific to SQL databases.
 
@@ -174,77 +175,82 @@ create_mssql_schema_info = partial(_create_sql_schema_info, mssql_dialect)
 create_mysql_schema_info = partial(_create_sql_schema_info, mysql_dialect)
 
 
-# Complete schema information sufficient to compile GraphQL queries for most backends
-CommonSchemaInfo = namedtuple(
-    "CommonSchemaInfo",
-    (
-        # GraphQLSchema
-        "schema",
-        # optional dict of GraphQL interface or type -> GraphQL union.
-        # Used as a workaround for GraphQL's lack of support for
-        # inheritance across "types" (i.e. non-interfaces), as well as a
-        # workaround for Gremlin's total lack of inheritance-awareness.
-        # The key-value pairs in the dict specify that the "key" type
-        # is equivalent to the "value" type, i.e. that the GraphQL type or
-        # interface in the key is the most-derived common supertype
-        # of every GraphQL type in the "value" GraphQL union.
-        # Recursive expansion of type equivalence hints is not performed,
-        # and only type-level correctness of this argument is enforced.
-        # See README.md for more details on everything this parameter does.
-        # *****
-        # Be very careful with this option, as bad input here will
-        # lead to incorrect output queries being generated.
-        # *****
-        "type_equivalence_hints",
-    ),
-)
-
-
-# Complete schema information sufficient to compile GraphQL queries to SQLAlchemy
-#
-# It describes the tables that correspond to each type (object type or interface type),
-# and gives instructions on how to perform joins for each vertex field. The property fields on each
-# type are implicitly mapped to columns with the same name on the corresponding table.
-#
-# NOTES:
-# - RootSchemaQuery is a special type that does not need a corresponding table.
-# - Builtin types like __Schema, __Type, etc. don't need corresponding tables.
-# - Builtin fields like _x_count do not need corresponding columns.
-SQLAlchemySchemaInfo = namedtuple(
-    "SQLAlchemySchemaInfo",
-    (
-        # GraphQLSchema
-        "schema",
-        # optional dict of GraphQL interface or type -> GraphQL union.
-        # Used as a workaround for GraphQL's lack of support for
-        # inheritance across "types" (i.e. non-interfaces), as well as a
-        # workaround for Gremlin's total lack of inheritance-awareness.
-        # The key-value pairs in the dict specify that the "key" type
-        # is equivalent to the "value" type, i.e. that the GraphQL type or
-        # interface in the key is the most-derived common supertype
-        # of every GraphQL type in the "value" GraphQL union.
-        # Recursive expansion of type equivalence hints is not performed,
-        # and only type-level correctness of this argument is enforced.
-        # See README.md for more details on everything this parameter does.
-        # *****
-        # Be very careful with this option, as bad input here will
-        # lead to incorrect output queries being generated.
-        # *****
-        "type_equivalence_hints",
-        # sqlalchemy.engine.interfaces.Dialect, specifying the dialect we are compiling for
-        # (e.g. sqlalchemy.dialects.mssql.dialect()).
-        "dialect",
-        # dict mapping every graphql object type or interface type name in the schema to
-        # a sqlalchemy table. Column types that do not exist for this dialect are not allowed.
-        # All tables are expected to have primary keys.
-        "vertex_name_to_table",
-        # dict mapping every graphql object type or interface type name in the schema to:
-        #    dict mapping every vertex field name at that type to a DirectJoinDescriptor. The
-        #    tables the join is to be performed on are not specified. They are inferred from
-        #    the schema and the tables dictionary.
-        "join_descriptors",
-    ),
-)
+class CommonSchemaInfo(NamedTuple):
+    """Complete schema information sufficient to compile GraphQL queries for most backends."""
+
+    # GraphQLSchema
+    schema: GraphQLSchema
+
+    # optional dict of GraphQL interface or type -> GraphQL union.
+    # Used as a workaround for GraphQL's lack of support for
+    # inheritance across "types" (i.e. non-interfaces), as well as a
+    # workaround for Gremlin's total lack of inheritance-awareness.
+    # The key-value pairs in the dict specify that the "key" type
+    # is equivalent to the "value" type, i.e. that the GraphQL type or
+    # interface in the key is the most-derived common supertype
+    # of every GraphQL type in the "value" GraphQL union.
+    # Recursive expansion of type equivalence hints is not performed,
+    # and only type-level correctness of this argument is enforced.
+    # See README.md for more details on everything this parameter does.
+    # *****
+    # Be very careful with this option, as bad input here will
+    # lead to incorrect output queries being generated.
+    # *****
+    type_equivalence_hints: Optional[TypeEquivalenceHintsType]
+
+
+class SQLAlchemySchemaInfo(NamedTuple):
+    """Complete schema information sufficient to compile GraphQL queries to SQLAlchemy.
+
+    It describes the tables that correspond to each type (object type or interface type),
+    and gives instructions on how to perform joins for each vertex field. The property fields
+    on each type are implicitly mapped to columns with the same name on the corresponding table.
+
+    NOTES:
+    - RootSchemaQuery is a special type that does not need a corresponding table.
+    - Builtin types like __Schema, __Type, etc. don't need corresponding tables.
+    - Builtin fields like _x_count do not need corresponding columns.
+    """
+
+    # GraphQLSchema
+    schema: GraphQLSchema
+
+    # optional dict of GraphQL interface or type -> GraphQL union.
+    # Used as a workaround for GraphQL's lack of support for
+    # inheritance across "types" (i.e. non-interfaces), as well as a
+    # workaround for Gremlin's total lack of inheritance-awareness.
+    # The key-value pairs in the dict specify that the "key" type
+    # is equivalent to the "value" type, i.e. that the GraphQL type or
+    # interface in the key is the most-derived common supertype
+    # of every GraphQL type in the "value" GraphQL union.
+    # Recursive expansion of type equivalence hints is not performed,
+    # and only type-level correctness of this argument is enforced.
+    # See README.md for more details on everything this parameter does.
+    # *****
+    # Be very careful with this option, as bad input here will
+    # lead to incorrect output queries being generated.
+    # *****
+    type_equivalence_hints: Optional[TypeEquivalenceHintsType]
+
+    # sqlalchemy.engine.interfaces.Dialect, specifying the dialect we are compiling for
+    # (e.g. sqlalchemy.dialects.mssql.dialect()).
+    dialect: Dialect
+
+    # dict mapping every graphql object type or interface type name in the schema to
+    # a sqlalchemy table. Column types that do not exist for this dialect are not allowed.
+    # All tables are expected to have primary keys.
+    vertex_name_to_table: Dict[str, sqlalchemy.Table]
+
+    # dict mapping every graphql object type or interface type name in the schema to:
+    #    dict mapping every vertex field name at that type to a DirectJoinDescriptor. The
+    #    tables the join is to be performed on are not specified. They are inferred from
+    #    the schema and the tables dictionary.
+    join_descriptors: Dict[str, Dict[str, DirectJoinDescriptor]]
+
+
+# Builtin fields (like _x_count) do not need corresponding columns on the underlying table.
+# Defined at module scope so validation does not reallocate the set on every call.
+_BUILTIN_FIELDS = frozenset({"_x_count"})
 
 
 def make_sqlalchemy_schema_info(
@@ -287,40 +293,45 @@ def make_sqlalchemy_schema_info(
     """
     if validate:
         types_to_map = (GraphQLInterfaceType, GraphQLObjectType)
-        builtin_fields = {
-            "_x_count",
-        }
         # TODO(bojanserafimov): More validation can be done:
         # - are the types of the columns compatible with the GraphQL type of the property field?
         # - do joins join on columns on which the (=) operator makes sense?
         # - do inherited columns have exactly the same type on the parent and child table?
         # - are all the column types available in this dialect?
-        for type_name, graphql_type in six.iteritems(schema.type_map):
-            if isinstance(graphql_type, types_to_map):
-                if type_name != "RootSchemaQuery" and not type_name.startswith("__"):
-                    # Check existence of sqlalchemy table for this type
-                    if type_name not in vertex_name_to_table:
-                        raise AssertionError(u"Table for type {} not found".format(type_name))
-                    table = vertex_name_to_table[type_name]
-                    if not isinstance(table, sqlalchemy.Table):
+        vertex_types = [
+            (type_name, graphql_type)
+            for type_name, graphql_type in schema.type_map.items()
+            if isinstance(graphql_type, types_to_map)
+            and type_name != "RootSchemaQuery"
+            and not type_name.startswith("__")
+        ]
+        is_vertex = is_vertex_field_name  # Local binding to avoid lookups in the loop below.
+        for type_name, graphql_type in vertex_types:
+            # Check existence of sqlalchemy table for this type
+            if type_name not in vertex_name_to_table:
+                raise AssertionError(u"Table for type {} not found".format(type_name))
+            table = vertex_name_to_table[type_name]
+            if not isinstance(table, sqlalchemy.Table):
+                raise AssertionError(
+                    u"Table for type {} has wrong type {}".format(type_name, type(table))
+                )
+            col_names = frozenset(table.c.keys())
+            joins_here = join_descriptors.get(type_name) or {}
+
+            # Check existence of all fields
+            for field_name in graphql_type.fields:
+                if is_vertex(field_name):
+                    if field_name not in joins_here:
                         raise AssertionError(
-                            u"Table for type {} has wrong type {}".format(type_name, type(table))
+                            u"No join descriptor was specified for vertex "
+                            u"field {} on type {}".format(field_name, type_name)
+                        )
+                else:
+                    if field_name not in _BUILTIN_FIELDS and field_name not in col_names:
+                        raise AssertionError(
+                            u"Table for type {} has no column "
+                            u"for property field {}".format(type_name, field_name)
                         )
-
-                    # Check existence of all fields
-                    for field_name in six.iterkeys(graphql_type.fields):
-                        if is_vertex_field_name(field_name):
-                            if field_name not in join_descriptors.get(type_name, {}):
-                                raise AssertionError(
-                                    u"No join descriptor was specified for vertex "
-                                    u"field {} on type {}".format(field_name, type_name)
-                                )
-                        else:
-                            if field_name not in builtin_fields and field_name not in table.c:
-                                raise AssertionError(
-                                    u"Table for type {} has no column "
-                                    u"for property field {}".format(type_name, field_name)
-                                )
 
     return SQLAlchemySchemaInfo(
         schema, type_equivalence_hints, dialect, vertex_name_to_table, join_descriptors
@@ -337,7 +348,7 @@ class EdgeConstraint(Enum):
     AtMostOneDestination = auto()
 
 
-@dataclass
+@dataclass(frozen=True)
 class QueryPlanningSchemaInfo:
     """All schema information sufficient for query cost estimation and auto pagination."""
 
@@ -5,6 +5,24 @@ from .edge_descriptors import get_join_descriptors_from_edge_descriptors
 from .schema_graph_builder import get_sqlalchemy_schema_graph
 
 
+# Cache of previously-built schema info, keyed on the identities of the input dicts, the
+# dialect name, and the (frozen) field type overrides. Each entry also holds strong references
+# to the keyed input dicts, so their ids cannot be reused while the entry is alive.
+_schema_info_cache = {}
+
+
+def _freeze_class_to_field_type_overrides(class_to_field_type_overrides):
+    """Convert the nested overrides dict into a hashable tuple-of-tuples cache key."""
+    if class_to_field_type_overrides is None:
+        return None
+    return tuple(
+        sorted(
+            (class_name, tuple(sorted(field_type_overrides.items())))
+            for class_name, field_type_overrides in class_to_field_type_overrides.items()
+        )
+    )
+
+
 def get_sqlalchemy_schema_info(
     vertex_name_to_table, direct_edges, dialect, class_to_field_type_overrides=None
 ):
@@ -49,7 +67,27 @@ def get_sqlalchemy_schema_info(
 
     Returns:
         SQLAlchemySchemaInfo containing the full information needed to compile SQL queries.
+
+    Results are memoized: repeated calls with the same vertex_name_to_table and direct_edges
+    dict objects, the same dialect name, and equal overrides return the same SQLAlchemySchemaInfo
+    without rebuilding the schema graph. The cache key uses the identity of the input dicts,
+    so mutating them after a call silently invalidates nothing -- callers that need a different
+    schema should build fresh dicts instead of mutating the ones they passed in. Dialects are
+    considered interchangeable by name: a cache hit returns the schema info built with the
+    first dialect instance of that name, ignoring any construction options (such as mssql's
+    legacy_schema_aliasing) that later instances might carry.
     """
+    cache_key = (
+        id(vertex_name_to_table),
+        id(direct_edges),
+        dialect.name,
+        _freeze_class_to_field_type_overrides(class_to_field_type_overrides),
+    )
+    cache_entry = _schema_info_cache.get(cache_key)
+    if cache_entry is not None:
+        _, _, schema_info = cache_entry
+        return schema_info
+
     schema_graph = get_sqlalchemy_schema_graph(vertex_name_to_table, direct_edges)
 
     graphql_schema, type_equivalence_hints = get_graphql_schema_from_schema_graph(
@@ -60,6 +98,8 @@ def get_sqlalchemy_schema_info(
 
     join_descriptors = get_join_descriptors_from_edge_descriptors(direct_edges)
 
-    return SQLAlchemySchemaInfo(
+    schema_info = SQLAlchemySchemaInfo(
         graphql_schema, type_equivalence_hints, dialect, vertex_name_to_table, join_descriptors
     )
+    _schema_info_cache[cache_key] = (vertex_name_to_table, direct_edges, schema_info)
+    return schema_info
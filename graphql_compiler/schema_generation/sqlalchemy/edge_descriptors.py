@@ -2,8 +2,6 @@
 from collections import namedtuple
 import warnings
 
-import six
-
 from ...schema import INBOUND_EDGE_FIELD_PREFIX, OUTBOUND_EDGE_FIELD_PREFIX
 from ...schema.schema_info import DirectJoinDescriptor
 from ..exceptions import InvalidSQLEdgeError
@@ -44,7 +42,7 @@ def validate_edge_descriptors(vertex_name_to_table, direct_edges):
     # TODO(pmantica1): Validate that columns in a direct SQL edge have comparable types.
     # TODO(pmantica1): Validate that columns don't have types that probably shouldn't be used for
     #                  joins, (e.g. array types).
-    for edge_name, direct_edge_descriptor in six.iteritems(direct_edges):
+    for edge_name, direct_edge_descriptor in direct_edges.items():
         for vertex_name, column_name in (
             (direct_edge_descriptor.from_vertex, direct_edge_descriptor.from_column),
             (direct_edge_descriptor.to_vertex, direct_edge_descriptor.to_column),
@@ -19,6 +19,7 @@ from ...schema_generation.exceptions import InvalidSQLEdgeError, MissingPrimaryK
 from ...schema_generation.schema_graph import IndexDefinition
 from ...schema_generation.sqlalchemy import (
     SQLAlchemySchemaInfo,
+    _freeze_class_to_field_type_overrides,
     get_graphql_schema_from_schema_graph,
     get_join_descriptors_from_edge_descriptors,
 )
@@ -308,3 +309,42 @@ class SQLAlchemySchemaInfoGenerationErrorTests(unittest.TestCase):
         faulty_vertex_name_to_table = {table_without_primary_key.name: table_without_primary_key}
         with self.assertRaises(MissingPrimaryKeyError):
             get_sqlalchemy_schema_info(faulty_vertex_name_to_table, {}, dialect())
+
+
+class SQLAlchemySchemaInfoMemoizationTests(unittest.TestCase):
+    def test_repeated_call_with_same_inputs_returns_same_instance(self):
+        vertex_name_to_table = _get_test_vertex_name_to_table()
+        direct_edges = _get_test_direct_edges()
+        first_schema_info = get_sqlalchemy_schema_info(
+            vertex_name_to_table, direct_edges, dialect()
+        )
+        second_schema_info = get_sqlalchemy_schema_info(
+            vertex_name_to_table, direct_edges, dialect()
+        )
+        self.assertIs(first_schema_info, second_schema_info)
+
+    def test_structurally_equal_but_distinct_inputs_produce_fresh_build(self):
+        first_schema_info = get_sqlalchemy_schema_info(
+            _get_test_vertex_name_to_table(), _get_test_direct_edges(), dialect()
+        )
+        second_schema_info = get_sqlalchemy_schema_info(
+            _get_test_vertex_name_to_table(), _get_test_direct_edges(), dialect()
+        )
+        self.assertIsNot(first_schema_info, second_schema_info)
+
+    def test_freeze_distinguishes_differing_overrides(self):
+        overrides = {"Table1": {"column_with_supported_type": GraphQLString}}
+        equal_overrides = {"Table1": {"column_with_supported_type": GraphQLString}}
+        different_overrides = {"Table1": {"column_with_supported_type": GraphQLInt}}
+        self.assertEqual(
+            _freeze_class_to_field_type_overrides(overrides),
+            _freeze_class_to_field_type_overrides(equal_overrides),
+        )
+        self.assertNotEqual(
+            _freeze_class_to_field_type_overrides(overrides),
+            _freeze_class_to_field_type_overrides(different_overrides),
+        )
+        self.assertNotEqual(
+            _freeze_class_to_field_type_overrides(overrides),
+            _freeze_class_to_field_type_overrides(None),
+        )